@@ -1,14 +1,28 @@
+import asyncio
+import atexit
+import contextlib
+import hashlib
 import json
 import logging
 import os
-import sys
+import re
 import time
 import traceback
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
+import aioboto3
+import httpx
+from botocore.exceptions import ClientError
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
 
 # Category ID to human-readable name mapping
 CATEGORY_MAPPING = {
@@ -20,36 +34,226 @@ CATEGORY_MAPPING = {
     "useful-link": "Useful Links"
 }
 
-def create_browser(p, retries=2):
+# Maximum number of category pages scraped concurrently
+MAX_CONCURRENCY = 5
+
+# Optional S3 bucket receiving one JSON object per scraped category
+BUCKET_NAME = os.environ.get('BUCKET_NAME')
+
+# Lambda allocates a second vCPU from this memory size; below it Chromium
+# is launched in single-process mode
+SINGLE_PROCESS_MAX_MEMORY_MB = 1769
+
+# Resource types and third-party hosts not needed for text extraction
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet", "other"}
+BLOCKED_DOMAINS = ("googletagmanager", "google-analytics", "doubleclick")
+
+# Small viewport and reduced motion keep layout work to a minimum for text scraping
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 800, "height": 600},
+    "reduced_motion": "reduce",
+    "java_script_enabled": True
+}
+
+# Event loop, Playwright driver and browser kept at module scope so that warm
+# Lambda containers reuse the running Chromium instead of relaunching it
+_LOOP = asyncio.new_event_loop()
+_PW = None
+_BROWSER = None
+
+# aioboto3 session used to upload category results while scraping continues
+_S3_SESSION = aioboto3.Session()
+
+# Shared HTTP client for the static (no-browser) scraping path
+_HTTP = httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    follow_redirects=True,
+    headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
+)
+
+def chromium_args():
+    """
+    Build the Chromium launch arguments. Single-process mode is only used when
+    the function has less than one full vCPU's worth of memory, since it
+    serializes the renderer and network work onto a single process.
+    """
+    args = [
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-dev-tools',
+        '--disable-gpu',
+        '--disable-extensions'
+    ]
+    
+    memory_mb = int(os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', 0))
+    if 0 < memory_mb < SINGLE_PROCESS_MAX_MEMORY_MB:
+        args += ['--single-process', '--no-zygote']
+    
+    return args
+
+async def create_browser(p, retries=2):
     """
     Attempt to create a browser instance with retries.
     """
     for attempt in range(retries + 1):
         try:
             logger.info(f"🌐 Launching headless browser (attempt {attempt + 1}/{retries + 1})...")
-            browser = p.chromium.launch(
+            browser = await p.chromium.launch(
                 headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-dev-tools',
-                    '--disable-gpu',
-                    '--disable-extensions',
-                    '--single-process',
-                    '--no-zygote'
-                ]
+                args=chromium_args()
             )
             logger.info("✅ Browser launched successfully")
             return browser
         except PlaywrightError as e:
             logger.error(f"❌ Failed to launch browser on attempt {attempt + 1}: {str(e)}")
             if attempt < retries:
-                time.sleep(1)
+                await asyncio.sleep(1)
             else:
                 raise Exception(f"Failed to launch browser after {retries + 1} attempts: {str(e)}")
 
-def extract_faqs_from_page(page):
+async def get_browser():
+    """
+    Return the module-level browser, launching it on first use or
+    relaunching it if the previous instance has disconnected.
+    """
+    global _PW, _BROWSER
+    
+    if _BROWSER is not None and _BROWSER.is_connected():
+        return _BROWSER
+    
+    if _PW is None:
+        _PW = await async_playwright().start()
+    
+    _BROWSER = await create_browser(_PW)
+    return _BROWSER
+
+def _shutdown_browser():
+    """
+    Close the warm browser and stop the Playwright driver on container shutdown.
+    """
+    async def _close():
+        if _BROWSER is not None and _BROWSER.is_connected():
+            await _BROWSER.close()
+        if _PW is not None:
+            await _PW.stop()
+        await _HTTP.aclose()
+    
+    try:
+        _LOOP.run_until_complete(_close())
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to shut down browser: {str(e)}")
+
+atexit.register(_shutdown_browser)
+
+async def block_non_essential(route):
+    """
+    Abort requests for resources the FAQ extraction does not need.
+    
+    Args:
+        route: Playwright route for the intercepted request
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(d in request.url for d in BLOCKED_DOMAINS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Selectors shared by the browser and selectolax extraction paths
+SEL_CARDBODY = 'div.card-body'
+SEL_QUESTION = 'h6.card-title'
+SEL_FAQ_READY = f'section#page-content {SEL_QUESTION}'
+SEL_NAV_TABS = 'ul.nav-tabs'
+SEL_NAV_LINKS = 'ul.nav-tabs li.nav-item a.nav-link'
+
+# Whitespace runs in source text, which innerText renders as a single space
+WHITESPACE = re.compile(r'\s+')
+
+# Reads the href of every element matched by the locator
+NAV_HREFS_JS = "links => links.map(link => link.getAttribute('href'))"
+
+def inner_text(node):
+    """
+    Approximate the browser's innerText for a selectolax node: <br> becomes a
+    line break and runs of source whitespace collapse to single spaces.
+    
+    Args:
+        node: selectolax node
+    
+    Returns:
+        Normalized text of the node
+    """
+    parts = []
+    for child in node.traverse(include_text=True):
+        if child.tag == '-text':
+            parts.append(WHITESPACE.sub(' ', child.text_content))
+        elif child.tag == 'br':
+            parts.append('\n')
+    return '\n'.join(' '.join(line.split()) for line in ''.join(parts).split('\n')).strip()
+
+def group_faq_rows(rows):
+    """
+    Partition a snapshot of card-body children into question-answer pairs.
+    Each h6.card-title starts a new question; the p.card-text paragraphs and
+    ul/ol list items that follow it, up to the next question, form its answer.
+    
+    Args:
+        rows: Iterable of (tag, class, text, li_texts) tuples
+    
+    Returns:
+        List of dictionaries containing question-answer pairs
+    """
+    pairs = []
+    question_text = None
+    answer_parts = []
+    debug = logger.isEnabledFor(logging.DEBUG)
+    
+    def flush():
+        if not answer_parts:
+            logger.warning("⚠️ No answer found for question: %s", question_text)
+        pairs.append((question_text, "\n\n".join(answer_parts)))
+        if debug:
+            logger.debug("✅ Extracted Q&A pair %d: %s", len(pairs), question_text)
+    
+    for tag_name, class_attr, text, items in rows:
+        if tag_name == 'h6' and 'card-title' in class_attr:
+            if question_text is not None:
+                flush()
+            question_text = text.strip()
+            # The joined answer has already been built, so the list can be reused
+            answer_parts.clear()
+        
+        elif question_text is None:
+            continue
+        
+        # Collect answer text from p.card-text elements
+        elif tag_name == 'p' and 'card-text' in class_attr:
+            text = text.strip()
+            if text:
+                answer_parts.append(text)
+        
+        # Also collect text from ul/ol lists that might be part of the answer
+        elif tag_name in ['ul', 'ol']:
+            # Number ordered items per list, skipping empty ones
+            ol_index = 1
+            for li_text in items:
+                li_text = li_text.strip()
+                if not li_text:
+                    continue
+                if tag_name == 'ul':
+                    answer_parts.append("• " + li_text)
+                else:
+                    answer_parts.append(f"{ol_index}. {li_text}")
+                    ol_index += 1
+    
+    if question_text is not None:
+        flush()
+    
+    # Dictionaries are only built at the JSON boundary
+    return [{"question": question, "answer": answer} for question, answer in pairs]
+
+async def extract_faqs_from_page(page):
     """
     Extract FAQ questions and answers from a single page.
     Based on the HTML structure analysis, questions are in h6.card-title
@@ -64,82 +268,63 @@ def extract_faqs_from_page(page):
     faq_data = []
     
     try:
-        # Wait for the main content to load
-        page.wait_for_selector('section#page-content', timeout=30000)
+        # Wait until the FAQ questions are attached to the DOM
+        await page.wait_for_selector(SEL_FAQ_READY, state='attached', timeout=15000)
         
-        # Find the card-body container that holds the FAQs
-        card_body = page.locator('div.card-body').first
+        # Serialize the rendered DOM once and parse it in-process
+        faq_data = extract_faqs_from_html(await page.content()) or []
+    
+    except Exception as e:
+        logger.error(f"❌ Error extracting FAQs from page: {str(e)}")
+    
+    return faq_data
+
+def extract_faqs_from_html(html):
+    """
+    Extract FAQ questions and answers from page HTML with selectolax.
+    Used on the raw response for server-rendered pages and on the
+    serialized DOM from page.content() when rendering with Chromium.
+    
+    Args:
+        html: Raw HTML of an FAQ category page
+    
+    Returns:
+        List of dictionaries containing question-answer pairs, or None if the
+        HTML has no FAQ container (the page is rendered by JavaScript)
+    """
+    faq_data = []
+    
+    try:
+        # Find the card-body containers that hold the FAQs
+        card_bodies = [
+            card_body for card_body in LexborHTMLParser(html).css(SEL_CARDBODY)
+            if card_body.css_first(SEL_QUESTION) is not None
+        ]
         
-        if not card_body.count():
+        if not card_bodies:
             logger.warning("No card-body container found")
-            return faq_data
+            return None
         
-        # Get all h6 question elements within the card-body
-        question_elements = card_body.locator('h6.card-title').all()
-        
-        logger.info(f"Found {len(question_elements)} questions on the page")
+        for card_body in card_bodies:
+            rows = (
+                (
+                    child.tag,
+                    child.attributes.get('class') or '',
+                    inner_text(child),
+                    [inner_text(li) for li in child.iter() if li.tag == 'li']
+                )
+                for child in card_body.iter()
+            )
+            faq_data.extend(group_faq_rows(rows))
         
-        for i, question_elem in enumerate(question_elements):
-            try:
-                question_text = question_elem.inner_text().strip()
-                logger.debug(f"Processing question {i+1}: {question_text}")
-                
-                # Find the answer by looking for p.card-text elements that follow this question
-                # We'll collect all p.card-text elements until we hit the next h6.card-title or end
-                answer_parts = []
-                
-                # Get all following siblings within the same card-body
-                following_elements = question_elem.locator('xpath=following-sibling::*').all()
-                
-                for elem in following_elements:
-                    tag_name = elem.evaluate('el => el.tagName.toLowerCase()')
-                    class_attr = elem.get_attribute('class') or ''
-                    
-                    # Stop if we hit another question
-                    if tag_name == 'h6' and 'card-title' in class_attr:
-                        break
-                    
-                    # Collect answer text from p.card-text elements
-                    if tag_name == 'p' and 'card-text' in class_attr:
-                        text = elem.inner_text().strip()
-                        if text:
-                            answer_parts.append(text)
-                    
-                    # Also collect text from ul/ol lists that might be part of the answer
-                    elif tag_name in ['ul', 'ol']:
-                        list_items = elem.locator('li').all()
-                        for li in list_items:
-                            li_text = li.inner_text().strip()
-                            if li_text:
-                                prefix = "• " if tag_name == 'ul' else f"{len(answer_parts) + 1}. "
-                                answer_parts.append(f"{prefix}{li_text}")
-                
-                # Join answer parts
-                if answer_parts:
-                    answer_text = "\n\n".join(answer_parts)
-                    faq_data.append({
-                        "question": question_text,
-                        "answer": answer_text
-                    })
-                    logger.debug(f"✅ Successfully extracted Q&A pair {i+1}")
-                else:
-                    logger.warning(f"⚠️ No answer found for question: {question_text}")
-                    # Still add the question with an empty answer for completeness
-                    faq_data.append({
-                        "question": question_text,
-                        "answer": ""
-                    })
-            
-            except Exception as e:
-                logger.error(f"❌ Error processing question {i+1}: {str(e)}")
-                continue
+        logger.info(f"Found {len(faq_data)} questions on the page")
     
     except Exception as e:
-        logger.error(f"❌ Error extracting FAQs from page: {str(e)}")
+        logger.error(f"❌ Error extracting FAQs from HTML: {str(e)}")
     
     return faq_data
 
-def get_faq_urls(page, base_url):
+async def get_faq_urls(page, base_url):
     """
     Extract FAQ category URLs from the navigation tabs.
     
@@ -154,17 +339,16 @@ def get_faq_urls(page, base_url):
     
     try:
         # Wait for navigation tabs to load
-        page.wait_for_selector('ul.nav-tabs', timeout=30000)
+        await page.wait_for_selector(SEL_NAV_TABS, timeout=30000)
         
-        # Find all navigation links
-        nav_links = page.locator('ul.nav-tabs li.nav-item a.nav-link').all()
+        # Read every navigation link's href in a single round-trip
+        hrefs = await page.locator(SEL_NAV_LINKS).evaluate_all(NAV_HREFS_JS)
         
-        for link in nav_links:
-            href = link.get_attribute('href')
+        for href in hrefs:
             if href and href.startswith('/app/faq'):
                 full_url = f"{base_url}{href}"
                 urls.append(full_url)
-                logger.debug(f"Found FAQ URL: {full_url}")
+                logger.debug("Found FAQ URL: %s", full_url)
         
         logger.info(f"Extracted {len(urls)} FAQ category URLs")
     
@@ -173,10 +357,341 @@ def get_faq_urls(page, base_url):
     
     return urls
 
-def lambda_handler(event=None, context=None):
+def get_faq_urls_from_html(html, base_url):
     """
-    AWS Lambda handler function to scrape FAQs from mycash.utah.gov.
-    Supports both Lambda execution and local testing.
+    Extract FAQ category URLs from the navigation tabs of raw page HTML.
+    
+    Args:
+        html: Raw HTML of an FAQ page
+        base_url: Base URL of the website
+    
+    Returns:
+        List of URLs for different FAQ categories
+    """
+    urls = []
+    
+    for link in LexborHTMLParser(html).css(SEL_NAV_LINKS):
+        href = link.attributes.get('href')
+        if href and href.startswith('/app/faq'):
+            urls.append(f"{base_url}{href}")
+    
+    logger.info(f"Extracted {len(urls)} FAQ category URLs")
+    return urls
+
+def default_faq_urls(base_url):
+    """
+    Get the default FAQ category URLs, used when discovery fails.
+    """
+    return [
+        f"{base_url}/app/faq-general",
+        f"{base_url}/app/faq-claim",
+        f"{base_url}/app/faq-evidence",
+        f"{base_url}/app/faq-report",
+        f"{base_url}/app/finder-info",
+        f"{base_url}/app/useful-link"
+    ]
+
+async def page_cache_key(url):
+    """
+    Derive a cache key for a page from its ETag and Last-Modified headers.
+    
+    Args:
+        url: FAQ category URL
+    
+    Returns:
+        Hex digest of the validators, or None when the server sends neither
+        or the HEAD request fails
+    """
+    try:
+        response = await _HTTP.head(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning(f"⚠️ HEAD request failed for {url}: {str(e)}")
+        return None
+    
+    validators = response.headers.get('etag', '') + response.headers.get('last-modified', '')
+    if not validators:
+        return None
+    return hashlib.blake2b(validators.encode()).hexdigest()
+
+async def load_cached_faqs(s3, category_id, cache_key):
+    """
+    Load a category's FAQs scraped from an identical version of the page.
+    
+    Args:
+        s3: aioboto3 S3 client, or None
+        category_id: The category identifier
+        cache_key: Key returned by page_cache_key, or None
+    
+    Returns:
+        List of FAQ dictionaries, or None on a cache miss
+    """
+    if s3 is None or cache_key is None:
+        return None
+    
+    try:
+        response = await s3.get_object(Bucket=BUCKET_NAME, Key=f"cache/{category_id}/{cache_key}.json")
+        async with response['Body'] as body:
+            return json.loads(await body.read())
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'NoSuchKey':
+            logger.warning(f"⚠️ Failed to read cached FAQs for '{category_id}': {str(e)}")
+        return None
+
+async def upload_category(s3, category_id, faq_data, cache_key=None):
+    """
+    Write one category's FAQs to S3 as faq/<category_id>.json and, when the
+    page has a cache key, to cache/<category_id>/<cache_key>.json.
+    Does nothing when no bucket is configured or nothing was extracted, so a
+    failed extraction never replaces the last good object.
+    
+    Args:
+        s3: aioboto3 S3 client, or None
+        category_id: The category identifier
+        faq_data: List of FAQ dictionaries for the category
+        cache_key: Key returned by page_cache_key, or None
+    """
+    if s3 is None or not faq_data:
+        return
+    
+    body = dumps(faq_data)
+    keys = [f"faq/{category_id}.json"]
+    if cache_key is not None:
+        keys.append(f"cache/{category_id}/{cache_key}.json")
+    
+    async def put(key):
+        try:
+            await s3.put_object(
+                Bucket=BUCKET_NAME,
+                Key=key,
+                Body=body,
+                ContentType='application/json'
+            )
+            logger.info(f"✅ Wrote s3://{BUCKET_NAME}/{key}")
+        except Exception as e:
+            logger.error(f"❌ Failed to write s3://{BUCKET_NAME}/{key}: {str(e)}")
+    
+    await asyncio.gather(*(put(key) for key in keys))
+
+def dumps(payload):
+    """
+    Serialize a payload to a compact JSON string, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, separators=(',', ':'))
+
+def category_from_url(url):
+    """
+    Extract category ID and human-readable name from an FAQ category URL.
+    
+    Args:
+        url: FAQ category URL
+    
+    Returns:
+        Tuple of (category_id, category_name)
+    """
+    category_id = url.rsplit('/', 1)[-1].partition('#')[0]  # Remove anchor if present
+    category_name = CATEGORY_MAPPING.get(category_id) or category_id.replace('-', ' ').title()
+    return category_id, category_name
+
+async def reset_page(page):
+    """
+    Navigate a page to about:blank so it can be reused after a failed load.
+    """
+    try:
+        await page.goto("about:blank")
+    except PlaywrightError as e:
+        logger.warning(f"⚠️ Failed to reset page: {str(e)}")
+
+async def scrape_category(page, url, s3=None, uploads=None):
+    """
+    Scrape FAQs from a single category URL, reusing the given page.
+    
+    Args:
+        page: Playwright page object reused across categories
+        url: FAQ category URL
+        s3: Optional aioboto3 S3 client receiving the category's FAQs
+        uploads: Optional list collecting the upload task, so the PUT overlaps
+            the next navigation; awaited inline when omitted
+    
+    Returns:
+        Tuple of (category_name, faq_data_list)
+    """
+    category_id, category_name = category_from_url(url)
+    
+    try:
+        # No validator cache here: the raw HTML's ETag/Last-Modified describe the
+        # app shell, not the FAQs the browser renders, so they never change
+        logger.info(f"🌐 Scraping category '{category_name}' from: {url}")
+        
+        # Navigate to FAQ page; extraction waits for the FAQ markup itself
+        await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        
+        # Extract FAQs using the improved method
+        faq_data = await extract_faqs_from_page(page)
+        
+        logger.info(f"✅ Extracted {len(faq_data)} FAQs from category '{category_name}'")
+        upload = upload_category(s3, category_id, faq_data)
+        if uploads is None:
+            await upload
+        else:
+            uploads.append(asyncio.create_task(upload))
+        return category_name, faq_data
+    
+    except (PlaywrightTimeoutError, PlaywrightError) as e:
+        logger.warning(f"⚠️ Failed to load {url}: {str(e)}")
+        await reset_page(page)
+        return category_name, []
+    
+    except Exception as e:
+        logger.error(f"❌ Error scraping {url}: {str(e)}")
+        await reset_page(page)
+        return category_name, []
+
+async def scrape_categories(context, urls, s3=None):
+    """
+    Scrape all category URLs with up to MAX_CONCURRENCY workers. Each worker
+    opens one page and reuses it for every URL it takes from the queue.
+    
+    Args:
+        context: Playwright browser context shared by all workers
+        urls: List of FAQ category URLs
+        s3: Optional aioboto3 S3 client receiving each category's FAQs
+    
+    Returns:
+        List of (category_name, faq_data_list) tuples, in URL order
+    """
+    queue = asyncio.Queue()
+    for index, url in enumerate(urls):
+        queue.put_nowait((index, url))
+    
+    results = [None] * len(urls)
+    uploads = []
+    
+    async def worker():
+        # Pages are closed together with the context
+        page = await context.new_page()
+        while not queue.empty():
+            index, url = queue.get_nowait()
+            results[index] = await scrape_category(page, url, s3, uploads)
+    
+    await asyncio.gather(*(worker() for _ in range(min(MAX_CONCURRENCY, len(urls)))))
+    
+    # S3 writes ran in the background while the workers moved on; finish them before the client closes
+    await asyncio.gather(*uploads)
+    return results
+
+async def scrape_category_static(sem, url, s3=None):
+    """
+    Scrape FAQs from a single category URL over plain HTTP.
+    
+    Args:
+        sem: Semaphore bounding the number of concurrent requests
+        url: FAQ category URL
+        s3: Optional aioboto3 S3 client receiving the category's FAQs
+    
+    Returns:
+        Tuple of (category_name, faq_data_list); faq_data_list is None when
+        the page has to be rendered with Chromium
+    """
+    category_id, category_name = category_from_url(url)
+    
+    async with sem:
+        try:
+            # Skip the page entirely if this version of it was already scraped
+            cache_key = await page_cache_key(url) if s3 is not None else None
+            faq_data = await load_cached_faqs(s3, category_id, cache_key)
+            if faq_data is not None:
+                logger.info(f"♻️ Reusing {len(faq_data)} cached FAQs for category '{category_name}'")
+                return category_name, faq_data
+            
+            logger.info(f"🌐 Fetching category '{category_name}' from: {url}")
+            
+            response = await _HTTP.get(url)
+            response.raise_for_status()
+            
+            faq_data = extract_faqs_from_html(response.text)
+            if faq_data is None:
+                logger.info(f"🖥️ Category '{category_name}' is rendered by JavaScript, deferring to Chromium")
+                return category_name, None
+            
+            logger.info(f"✅ Extracted {len(faq_data)} FAQs from category '{category_name}'")
+            await upload_category(s3, category_id, faq_data, cache_key)
+            return category_name, faq_data
+        
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️ Failed to fetch {url}, deferring to Chromium: {str(e)}")
+            return category_name, None
+
+async def scrape_with_http(urls, base_url, s3=None):
+    """
+    Scrape all categories with httpx + selectolax, without launching Chromium.
+    
+    Returns:
+        Tuple of (urls, list of (category_name, faq_data_list))
+    """
+    # If no URLs provided, extract them from the main FAQ page
+    if not urls:
+        logger.info("🔍 No URLs provided in event. Extracting FAQ category URLs...")
+        try:
+            response = await _HTTP.get(f"{base_url}/app/faq-general")
+            response.raise_for_status()
+            urls = get_faq_urls_from_html(response.text, base_url)
+        except httpx.HTTPError as e:
+            logger.error(f"Error extracting FAQ URLs: {str(e)}")
+        
+        if not urls:
+            urls = default_faq_urls(base_url)
+            logger.info(f"Using fallback URLs: {urls}")
+    
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    results = await asyncio.gather(*(scrape_category_static(sem, url, s3) for url in urls))
+    return urls, results
+
+async def scrape_with_browser(urls, base_url, s3=None):
+    """
+    Scrape all categories with headless Chromium, for pages that need JavaScript.
+    
+    Returns:
+        Tuple of (urls, list of (category_name, faq_data_list))
+    """
+    # Reuse the warm browser; only the context is created per invocation
+    browser = await get_browser()
+    context = await browser.new_context(**CONTEXT_OPTIONS)
+    await context.route("**/*", block_non_essential)
+    
+    try:
+        # If no URLs provided, extract them from the main FAQ page
+        if not urls:
+            logger.info("🔍 No URLs provided in event. Extracting FAQ category URLs...")
+            page = await context.new_page()
+            
+            try:
+                logger.info(f"Navigating to {base_url}/app/faq-general")
+                await page.goto(f"{base_url}/app/faq-general", wait_until='domcontentloaded', timeout=30000)
+                urls = await get_faq_urls(page, base_url)
+                
+                if not urls:
+                    # Fallback to default URLs if extraction fails
+                    urls = default_faq_urls(base_url)
+                    logger.info(f"Using fallback URLs: {urls}")
+            
+            finally:
+                await page.close()
+        
+        # Scrape FAQs from all URLs concurrently on a small pool of reused pages
+        results = await scrape_categories(context, urls, s3)
+        return urls, results
+    
+    finally:
+        await context.close()
+
+async def _run(event):
+    """
+    Scrape FAQs from mycash.utah.gov, loading all category pages concurrently.
+    Pages are fetched over plain HTTP; categories without server-rendered FAQ
+    markup fall back to Chromium, and "render_js" forces Chromium for all.
     """
     start_time = time.time()
     all_faq_data = []
@@ -192,78 +707,27 @@ def lambda_handler(event=None, context=None):
         # Check if URLs are provided in the event, else scrape them
         urls = event.get("urls", [])
         
-        with sync_playwright() as p:
-            browser = create_browser(p)
-            context = browser.new_context()
-            
-            # If no URLs provided, extract them from the main FAQ page
-            if not urls:
-                logger.info("🔍 No URLs provided in event. Extracting FAQ category URLs...")
-                page = context.new_page()
-                
-                try:
-                    logger.info(f"Navigating to {base_url}/app/faq-general")
-                    page.goto(f"{base_url}/app/faq-general", wait_until='networkidle', timeout=30000)
-                    urls = get_faq_urls(page, base_url)
-                    
-                    if not urls:
-                        # Fallback to default URLs if extraction fails
-                        urls = [
-                            f"{base_url}/app/faq-general",
-                            f"{base_url}/app/faq-claim",
-                            f"{base_url}/app/faq-evidence",
-                            f"{base_url}/app/faq-report",
-                            f"{base_url}/app/finder-info",
-                            f"{base_url}/app/useful-link"
-                        ]
-                        logger.info(f"Using fallback URLs: {urls}")
-                
-                finally:
-                    page.close()
-
-            # Scrape FAQs from each URL
-            grouped_faqs = {}
-            
-            for url in urls:
-                page = context.new_page()
-                try:
-                    # Extract category ID from URL
-                    category_id = url.split('/')[-1].split('#')[0]  # Remove anchor if present
-                    category_name = CATEGORY_MAPPING.get(category_id, category_id.replace('-', ' ').title())
-                    
-                    logger.info(f"🌐 Scraping category '{category_name}' from: {url}")
-                    
-                    # Navigate to FAQ page
-                    page.goto(url, wait_until='networkidle', timeout=30000)
-                    
-                    # Wait a bit for any dynamic content to load
-                    page.wait_for_timeout(3000)
-                    
-                    # Extract FAQs using the improved method
-                    faq_data = extract_faqs_from_page(page)
-                    
-                    grouped_faqs[category_name] = faq_data
-                    all_faq_data.extend(faq_data)
-                    
-                    logger.info(f"✅ Extracted {len(faq_data)} FAQs from category '{category_name}'")
-                
-                except (PlaywrightTimeoutError, PlaywrightError) as e:
-                    logger.warning(f"⚠️ Failed to load {url}: {str(e)}")
-                    category_id = url.split('/')[-1].split('#')[0]
-                    category_name = CATEGORY_MAPPING.get(category_id, category_id.replace('-', ' ').title())
-                    grouped_faqs[category_name] = []
-                
-                except Exception as e:
-                    logger.error(f"❌ Error scraping {url}: {str(e)}")
-                    category_id = url.split('/')[-1].split('#')[0]
-                    category_name = CATEGORY_MAPPING.get(category_id, category_id.replace('-', ' ').title())
-                    grouped_faqs[category_name] = []
+        # Upload each category to S3 as soon as it is extracted, if a bucket is configured
+        s3_client = _S3_SESSION.client('s3') if BUCKET_NAME else contextlib.nullcontext()
+        
+        async with s3_client as s3:
+            if event.get("render_js"):
+                urls, results = await scrape_with_browser(urls, base_url, s3)
+            else:
+                urls, results = await scrape_with_http(urls, base_url, s3)
                 
-                finally:
-                    page.close()
-            
-            context.close()
-            browser.close()
+                # Render the categories whose FAQs are not in the raw HTML
+                pending = [url for url, (_, faq_data) in zip(urls, results) if faq_data is None]
+                if pending:
+                    _, rendered = await scrape_with_browser(pending, base_url, s3)
+                    rendered = iter(rendered)
+                    results = [next(rendered) if faq_data is None else (category_name, faq_data)
+                               for category_name, faq_data in results]
+        
+        grouped_faqs = {}
+        for category_name, faq_data in results:
+            grouped_faqs[category_name] = faq_data
+            all_faq_data.extend(faq_data)
         
         execution_time = time.time() - start_time
         logger.info(f"✅ Total extracted {len(all_faq_data)} FAQs in {execution_time:.2f} seconds")
@@ -275,7 +739,7 @@ def lambda_handler(event=None, context=None):
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps({
+            "body": dumps({
                 "success": True,
                 "count": len(all_faq_data),
                 "data": grouped_faqs,
@@ -284,9 +748,9 @@ def lambda_handler(event=None, context=None):
             })
         }
         
-        # For local testing, print the response
+        # For local testing, print the response (pretty-printed only with DEBUG set)
         if event == {"urls": []}:
-            print(json.dumps(response, indent=2))
+            print(json.dumps(response, indent=2) if os.environ.get('DEBUG') else dumps(response))
         
         return response
     
@@ -301,7 +765,7 @@ def lambda_handler(event=None, context=None):
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps({
+            "body": dumps({
                 "success": False,
                 "error": str(e),
                 "execution_time": f"{execution_time:.2f} seconds",
@@ -309,12 +773,19 @@ def lambda_handler(event=None, context=None):
             })
         }
         
-        # For local testing, print the error response
+        # For local testing, print the error response (pretty-printed only with DEBUG set)
         if event == {"urls": []}:
-            print(json.dumps(response, indent=2))
+            print(json.dumps(response, indent=2) if os.environ.get('DEBUG') else dumps(response))
         
         return response
 
+def lambda_handler(event=None, context=None):
+    """
+    AWS Lambda handler function to scrape FAQs from mycash.utah.gov.
+    Supports both Lambda execution and local testing.
+    """
+    return _LOOP.run_until_complete(_run(event))
+
 if __name__ == "__main__":
     # Support local execution for debugging
     lambda_handler()
\ No newline at end of file
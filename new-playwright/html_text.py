@@ -0,0 +1,23 @@
+import re
+
+# Whitespace runs in source text, which innerText renders as a single space
+WHITESPACE = re.compile(r'\s+')
+
+def inner_text(node):
+    """
+    Approximate the browser's innerText for a selectolax node: <br> becomes a
+    line break and runs of source whitespace collapse to single spaces.
+    
+    Args:
+        node: selectolax node
+        
+    Returns:
+        Normalized text of the node
+    """
+    parts = []
+    for child in node.traverse(include_text=True):
+        if child.tag == '-text':
+            parts.append(WHITESPACE.sub(' ', child.text_content))
+        elif child.tag == 'br':
+            parts.append('\n')
+    return '\n'.join(' '.join(line.split()) for line in ''.join(parts).split('\n')).strip()
@@ -1,17 +1,14 @@
+import asyncio
+import functools
+import importlib
 import logging
-import time
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
-from faq_general import extract_faq_general
-from faq_claim import extract_faq_claim
-from faq_evidence import extract_faq_evidence
-from faq_report import extract_faq_report
-from finder_info import extract_finder_info
-from useful_link import extract_useful_link
+import re
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
 import json
 
 # Configure logging
 logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)  # Set to DEBUG for detailed output
+logger.setLevel(logging.INFO)  # Set to DEBUG for detailed output
 handler = logging.StreamHandler()
 formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 handler.setFormatter(formatter)
@@ -27,13 +24,50 @@ CATEGORY_MAPPING = {
     "useful-link": "Useful Links"
 }
 
+# Category ID to extractor module; modules are imported on first use
+_EXTRACTOR_MODULES = {
+    "faq-general": "faq_general",
+    "faq-claim": "faq_claim",
+    "faq-evidence": "faq_evidence",
+    "faq-report": "faq_report",
+    "finder-info": "finder_info",
+    "useful-link": "useful_link"
+}
+
+# Selectors that signal a category page's content has loaded
+_READY_SELECTORS = {
+    "useful-link": "section#page-content div.card-body a"
+}
+_DEFAULT_READY_SELECTOR = "section#page-content div.card-body h6.card-title"
+
+@functools.lru_cache(maxsize=None)
+def _category_name(category_id):
+    """Human-readable name for a category, derived from its ID if not mapped"""
+    return CATEGORY_MAPPING.get(category_id) or category_id.replace('-', ' ').title()
+
+@functools.lru_cache(maxsize=None)
+def _load_extractor(module_name, suffix=''):
+    """Import an extractor module on first use and return its extract_<module><suffix> function"""
+    return getattr(importlib.import_module(module_name), f"extract_{module_name}{suffix}")
+
+# Maximum number of category pages scraped concurrently
+MAX_CONCURRENCY = 5
+
+# Replace a worker's page after this many navigations to bound renderer memory growth
+PAGE_RECYCLE_AFTER = 10
+
+# Resource types and third-party hosts not needed for text extraction
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet', 'other'}
+BLOCKED_HOSTS = re.compile(r'google-analytics\.com|googletagmanager\.com|doubleclick\.net')
+
 class FAQScraper:
     """
     A utility class to scrape FAQs from mycash.utah.gov
     """
     
-    def __init__(self, base_url):
+    def __init__(self, base_url, max_concurrency=MAX_CONCURRENCY):
         self.base_url = base_url
+        self.max_concurrency = max_concurrency
         self.browser = None
         self.context = None
     
@@ -53,7 +87,7 @@ class FAQScraper:
             f"{self.base_url}/app/useful-link"
         ]
     
-    def create_browser(self, p, retries=2):
+    async def create_browser(self, p, retries=2):
         """
         Attempt to create a browser instance with retries.
         
@@ -67,7 +101,7 @@ class FAQScraper:
         for attempt in range(retries + 1):
             try:
                 logger.info(f"🌐 Launching headless browser (attempt {attempt + 1}/{retries + 1})...")
-                browser = p.chromium.launch(
+                browser = await p.chromium.launch(
                     headless=True,
                     args=[
                         '--no-sandbox',
@@ -77,18 +111,44 @@ class FAQScraper:
                         '--disable-gpu',
                         '--disable-extensions',
                         '--single-process',
-                        '--no-zygote'
-                    ]
+                        '--no-zygote',
+                        '--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter',
+                        '--disable-background-networking',
+                        '--disable-default-apps',
+                        '--disable-sync',
+                        '--metrics-recording-only',
+                        '--no-first-run',
+                        '--mute-audio',
+                        '--hide-scrollbars',
+                        '--disable-breakpad',
+                        '--disable-client-side-phishing-detection',
+                        '--disable-component-update',
+                        '--disable-ipc-flooding-protection'
+                    ],
+                    ignore_default_args=['--enable-automation']
                 )
                 logger.info("✅ Browser launched successfully")
                 return browser
             except PlaywrightError as e:
                 logger.error(f"❌ Failed to launch browser on attempt {attempt + 1}: {str(e)}")
                 if attempt < retries:
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                 else:
                     raise Exception(f"Failed to launch browser after {retries + 1} attempts: {str(e)}")
     
+    async def block_non_essential(self, route):
+        """
+        Abort requests for resources the FAQ extraction does not need.
+        
+        Args:
+            route: Playwright route for the intercepted request
+        """
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOSTS.search(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
     def extract_category_from_url(self, url):
         """
         Extract category information from URL.
@@ -100,7 +160,7 @@ class FAQScraper:
             Tuple of (category_id, category_name)
         """
         category_id = url.split('/')[-1].split('#')[0]  # Remove anchor if present
-        category_name = CATEGORY_MAPPING.get(category_id, category_id.replace('-', ' ').title())
+        category_name = _category_name(category_id)
         return category_id, category_name
     
     def get_extraction_method(self, category_id):
@@ -113,44 +173,45 @@ class FAQScraper:
         Returns:
             Extraction method function
         """
-        method_mapping = {
-            "faq-general": extract_faq_general,
-            "faq-claim": extract_faq_claim,
-            "faq-evidence": extract_faq_evidence,
-            "faq-report": extract_faq_report,
-            "finder-info": extract_finder_info,
-            "useful-link": extract_useful_link
-        }
+        return _load_extractor(_EXTRACTOR_MODULES.get(category_id, "faq_general"))
+    
+    def get_ready_selector(self, category_id):
+        """
+        Get the selector that signals a category page's content has loaded.
         
-        return method_mapping.get(category_id, extract_faq_general)  # Default to general extraction
+        Args:
+            category_id: The category identifier
+            
+        Returns:
+            CSS selector string
+        """
+        return _READY_SELECTORS.get(category_id, _DEFAULT_READY_SELECTOR)
     
-    def scrape_single_category(self, url):
+    async def scrape_single_category(self, url, page):
         """
-        Scrape FAQs from a single category URL.
+        Scrape FAQs from a single category URL, reusing the given page.
         
         Args:
             url: FAQ category URL
+            page: Playwright page object reused across categories
             
         Returns:
             Tuple of (category_name, faq_data_list)
         """
         category_id, category_name = self.extract_category_from_url(url)
-        page = self.context.new_page()
         
         try:
             logger.info(f"🌐 Scraping category '{category_name}' from: {url}")
             
-            # Navigate to FAQ page
-            page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            # Wait a bit for any dynamic content to load
-            page.wait_for_timeout(3000)
+            # Navigate to FAQ page and wait only until the category's content is in the DOM
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await page.wait_for_selector(self.get_ready_selector(category_id), state='attached', timeout=15000)
             
             # Get the appropriate extraction method for this category
             extraction_method = self.get_extraction_method(category_id)
             
             # Extract FAQs using the category-specific method
-            faq_data = extraction_method(page)
+            faq_data = await extraction_method(page)
             
             logger.info(f"✅ Extracted {len(faq_data)} FAQs from category '{category_name}'")
             return category_name, faq_data
@@ -162,13 +223,40 @@ class FAQScraper:
         except Exception as e:
             logger.error(f"❌ Error scraping {url}: {str(e)}")
             return category_name, []
+    
+    async def _worker(self, queue, results):
+        """
+        Scrape URLs from the queue on a single page, replacing the page every
+        PAGE_RECYCLE_AFTER navigations.
+        
+        Args:
+            queue: Queue of (index, url) pairs shared by all workers
+            results: List receiving each (category_name, faq_data_list) at its URL's index
+        """
+        page = None
+        page_uses = 0
+        
+        try:
+            while not queue.empty():
+                index, url = queue.get_nowait()
+                
+                if page is None or page_uses >= PAGE_RECYCLE_AFTER:
+                    if page is not None:
+                        await page.close()
+                    page = await self.context.new_page()
+                    page_uses = 0
+                
+                results[index] = await self.scrape_single_category(url, page)
+                page_uses += 1
         
         finally:
-            page.close()
+            if page is not None:
+                await page.close()
     
-    def scrape_all_categories(self, urls):
+    async def scrape_all_categories(self, urls):
         """
-        Scrape FAQs from all provided URLs.
+        Scrape FAQs from all provided URLs with up to max_concurrency workers,
+        each reusing one page for the URLs it takes from a shared queue.
         
         Args:
             urls: List of FAQ category URLs
@@ -179,19 +267,34 @@ class FAQScraper:
         grouped_faqs = {}
         total_count = 0
         
-        with sync_playwright() as p:
-            self.browser = self.create_browser(p)
-            self.context = self.browser.new_context()
+        async with async_playwright() as p:
+            self.browser = await self.create_browser(p)
+            self.context = await self.browser.new_context()
+            await self.context.route('**/*', self.block_non_essential)
             
             try:
-                for url in urls:
-                    category_name, faq_data = self.scrape_single_category(url)
+                queue = asyncio.Queue()
+                for index, url in enumerate(urls):
+                    queue.put_nowait((index, url))
+                
+                results = [None] * len(urls)
+                workers = [self._worker(queue, results) for _ in range(min(self.max_concurrency, len(urls)))]
+                for error in await asyncio.gather(*workers, return_exceptions=True):
+                    if isinstance(error, Exception):
+                        logger.error(f"❌ Scraping worker failed: {str(error)}")
+                
+                for url, result in zip(urls, results):
+                    if result is None:
+                        _, category_name = self.extract_category_from_url(url)
+                        result = (category_name, [])
+                    
+                    category_name, faq_data = result
                     grouped_faqs[category_name] = faq_data
                     total_count += len(faq_data)
                 
             finally:
-                self.context.close()
-                self.browser.close()
+                await self.context.close()
+                await self.browser.close()
         
         return grouped_faqs, total_count
 
@@ -210,7 +313,7 @@ def lambda_handler(event, context):
     scraper = FAQScraper(base_url)
     urls = scraper.get_default_faq_urls()
     
-    grouped_faqs, total_count = scraper.scrape_all_categories(urls)
+    grouped_faqs, total_count = asyncio.run(scraper.scrape_all_categories(urls))
     
     return {
         'statusCode': 200,
@@ -226,7 +329,7 @@ if __name__ == "__main__":
     scraper = FAQScraper(base_url)
     urls = scraper.get_default_faq_urls()
     
-    grouped_faqs, total_count = scraper.scrape_all_categories(urls)
+    grouped_faqs, total_count = asyncio.run(scraper.scrape_all_categories(urls))
     
     # Print results in a readable format
     print(json.dumps({
@@ -1,8 +1,10 @@
 import logging
+from selectolax.lexbor import LexborHTMLParser
+from html_text import inner_text
 
 logger = logging.getLogger()
 
-def extract_useful_link(page):
+async def extract_useful_link(page):
     """
     Extract information from Useful Links category page.
     Assumes links are primary content, possibly with descriptions.
@@ -17,43 +19,44 @@ def extract_useful_link(page):
     
     try:
         # Wait for the main content to load
-        page.wait_for_selector('section#page-content', timeout=30000)
+        await page.wait_for_selector('section#page-content', timeout=30000)
         
-        # Find the card-body container that holds the content
-        card_body = page.locator('div.card-body').first
+        # Serialize the rendered DOM once and parse it without further round-trips
+        tree = LexborHTMLParser(await page.content())
+        faq_data = extract_useful_link_static(tree)
         
-        if not card_body.count():
-            logger.warning("No card-body container found")
-            return faq_data
-        
-        # Get all link elements (assuming links are in <a> tags)
-        link_elements = card_body.locator('a').all()
-        
-        logger.info(f"Found {len(link_elements)} links on the page")
-        
-        for i, link_elem in enumerate(link_elements):
-            try:
-                link_text = link_elem.inner_text().strip()
-                href = link_elem.get_attribute('href') or ''
-                
-                if not link_text or not href:
-                    logger.debug(f"Skipping empty link at index {i+1}")
-                    continue
-                
-                logger.debug(f"Processing link {i+1}: {link_text}")
-                
-                # Treat link text as question and href as answer
-                faq_data.append({
-                    "question": link_text,
-                    "answer": f"[{link_text}]({href})"
-                })
-                logger.debug(f"✅ Successfully extracted link {i+1}")
-            
-            except Exception as e:
-                logger.error(f"❌ Error processing link {i+1}: {str(e)}")
-                continue
+        logger.info(f"Found {len(faq_data)} links on the page")
     
     except Exception as e:
         logger.error(f"❌ Error extracting links from page: {str(e)}")
     
+    return faq_data
+
+def extract_useful_link_static(tree):
+    """
+    Extract links from a parsed Useful Links page.
+    Works on raw server HTML or on the DOM serialized by page.content().
+    
+    Args:
+        tree: Parsed selectolax tree of the category page
+        
+    Returns:
+        List of FAQ dictionaries
+    """
+    card_body = tree.css_first('div.card-body')
+    
+    if card_body is None:
+        logger.warning("No card-body container found")
+        return []
+    
+    faq_data = []
+    for link_elem in card_body.css('a'):
+        text = inner_text(link_elem)
+        href = link_elem.attributes.get('href') or ''
+        if text and href:
+            faq_data.append({
+                "question": text,
+                "answer": f"[{text}]({href})"
+            })
+    
     return faq_data
\ No newline at end of file
@@ -1,8 +1,10 @@
 import logging
+from selectolax.lexbor import LexborHTMLParser
+from html_text import inner_text
 
 logger = logging.getLogger()
 
-def extract_faq_general(page):
+async def extract_faq_general(page):
     """
     Extract FAQs from General category page.
     Assumes questions in h6.card-title and answers in p.card-text or lists.
@@ -17,74 +19,79 @@ def extract_faq_general(page):
     
     try:
         # Wait for the main content to load
-        page.wait_for_selector('section#page-content', timeout=30000)
+        await page.wait_for_selector('section#page-content', timeout=30000)
         
-        # Find the card-body container that holds the FAQs
-        card_body = page.locator('div.card-body').first
+        # Serialize the rendered DOM once and parse it without further round-trips
+        tree = LexborHTMLParser(await page.content())
+        faq_data = extract_faq_general_static(tree)
         
-        if not card_body.count():
-            logger.warning("No card-body container found")
-            return faq_data
+        logger.info(f"Found {len(faq_data)} questions on the page")
         
-        # Get all h6 question elements within the card-body
-        question_elements = card_body.locator('h6.card-title').all()
+        for faq in faq_data:
+            if not faq['answer']:
+                logger.warning("⚠️ No answer found for question: %s", faq['question'])
+    
+    except Exception as e:
+        logger.error(f"❌ Error extracting FAQs from page: {str(e)}")
+    
+    return faq_data
+
+def extract_faq_general_static(tree):
+    """
+    Extract FAQs from a parsed General page.
+    Works on raw server HTML or on the DOM serialized by page.content().
+    
+    Args:
+        tree: Parsed selectolax tree of the category page
+        
+    Returns:
+        List of FAQ dictionaries
+    """
+    card_body = tree.css_first('div.card-body')
+    
+    if card_body is None:
+        logger.warning("No card-body container found")
+        return []
+    
+    faq_data = []
+    question_text = None
+    answer_parts = []
+    
+    for elem in card_body.iter():
+        tag_name = elem.tag
+        class_attr = elem.attributes.get('class') or ''
+        
+        # Each question starts a new Q&A pair
+        if tag_name == 'h6' and 'card-title' in class_attr:
+            if question_text is not None:
+                faq_data.append({"question": question_text, "answer": "\n\n".join(answer_parts)})
+            question_text = inner_text(elem)
+            answer_parts = []
+        
+        elif question_text is None:
+            continue
         
-        logger.info(f"Found {len(question_elements)} questions on the page")
+        # Collect answer text from p.card-text elements
+        elif tag_name == 'p' and 'card-text' in class_attr:
+            text = inner_text(elem)
+            if text:
+                answer_parts.append(text)
         
-        for i, question_elem in enumerate(question_elements):
-            try:
-                question_text = question_elem.inner_text().strip()
-                logger.debug(f"Processing question {i+1}: {question_text}")
-                
-                # Find the answer by looking for p.card-text elements that follow this question
-                answer_parts = []
-                
-                # Get all following siblings within the same card-body
-                following_elements = question_elem.locator('xpath=following-sibling::*').all()
-                
-                for elem in following_elements:
-                    tag_name = elem.evaluate('el => el.tagName.toLowerCase()')
-                    class_attr = elem.get_attribute('class') or ''
-                    
-                    # Stop if we hit another question
-                    if tag_name == 'h6' and 'card-title' in class_attr:
-                        break
-                    
-                    # Collect answer text from p.card-text elements
-                    if tag_name == 'p' and 'card-text' in class_attr:
-                        text = elem.inner_text().strip()
-                        if text:
-                            answer_parts.append(text)
-                    
-                    # Collect text from ul/ol lists that might be part of the answer
-                    elif tag_name in ['ul', 'ol']:
-                        list_items = elem.locator('li').all()
-                        for li in list_items:
-                            li_text = li.inner_text().strip()
-                            if li_text:
-                                prefix = "• " if tag_name == 'ul' else f"{len(answer_parts) + 1}. "
-                                answer_parts.append(f"{prefix}{li_text}")
-                
-                # Join answer parts
-                if answer_parts:
-                    answer_text = "\n\n".join(answer_parts)
-                    faq_data.append({
-                        "question": question_text,
-                        "answer": answer_text
-                    })
-                    logger.debug(f"✅ Successfully extracted Q&A pair {i+1}")
+        # Collect text from ul/ol lists that might be part of the answer
+        elif tag_name in ['ul', 'ol']:
+            # Number ordered items per list, skipping empty ones
+            ol_index = 1
+            for li in elem.css('li'):
+                li_text = inner_text(li)
+                if not li_text:
+                    continue
+                if tag_name == 'ul':
+                    answer_parts.append("• " + li_text)
                 else:
-                    logger.warning(f"⚠️ No answer found for question: {question_text}")
-                    faq_data.append({
-                        "question": question_text,
-                        "answer": ""
-                    })
-            
-            except Exception as e:
-                logger.error(f"❌ Error processing question {i+1}: {str(e)}")
-                continue
+                    answer_parts.append(f"{ol_index}. {li_text}")
+                    ol_index += 1
     
-    except Exception as e:
-        logger.error(f"❌ Error extracting FAQs from page: {str(e)}")
+    if question_text is not None:
+        faq_data.append({"question": question_text, "answer": "\n\n".join(answer_parts)})
     
     return faq_data
\ No newline at end of file
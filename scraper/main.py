@@ -1,77 +1,335 @@
 
+import os
 import time
 import json
 import logging
+import shutil
+import httpx
+from multiprocessing import Pipe, Process
 from selenium import webdriver
 from tempfile import mkdtemp
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selectolax.lexbor import LexborHTMLParser
+from html_text import inner_text
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logger
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# FAQ question headings
+_TITLE_SELECTOR = "h6.card-title"
+
+# Seconds a plain-HTTP FAQ extraction is reused by a warm container
+STATIC_CACHE_TTL = 300
+
+# Upper bounds (seconds) so a hung page fails fast instead of running into the Lambda timeout
+PAGE_LOAD_TIMEOUT = 10
+SCRIPT_TIMEOUT = 5
+
+# Each parallel worker's Chrome needs its own DevTools port
+DEBUGGING_PORT = 9222
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+
+# Chrome kept warm across invocations of the same Lambda container
+_DRIVER = None
+
+# url -> (fetched_at, faqs) for server-rendered pages
+_STATIC_CACHE = {}
+
+# Profile, data and cache dirs for the warm Chrome, created once per container
+_USER_DIR, _DATA_DIR, _CACHE_DIR = mkdtemp(), mkdtemp(), mkdtemp()
+
+# Pairs every question heading with the first paragraph after it (or, failing that,
+# the first paragraph in its container longer than the question) in one round-trip.
+# Repeated questions are skipped before their answers are looked up.
+EXTRACT_FAQS_JS = """
+let hs = document.querySelectorAll('h6.card-title');
+if (!hs.length) hs = document.querySelectorAll('h6');
+const seen = new Set();
+const faqs = [];
+Array.from(hs).forEach((h, i) => {
+    const q = h.innerText.trim();
+    if (q.length < 5 || seen.has(q)) return;
+    seen.add(q);
+    let a = '';
+    let sib = h.nextElementSibling;
+    while (sib && sib.tagName !== 'P') sib = sib.nextElementSibling;
+    if (sib) {
+        a = sib.innerText.trim();
+    } else {
+        const ps = h.parentElement ? h.parentElement.querySelectorAll('p') : [];
+        for (const p of ps) {
+            const t = p.innerText.trim();
+            if (t.length > q.length) { a = t; break; }
+        }
+        a = a || 'Answer not found';
+    }
+    faqs.push({id: 'faq-' + (i + 1), question: q, answer: a, order: i + 1});
+});
+return faqs;
+"""
+
+def _dumps(payload):
+    """Serialise a response body; Lambda needs a str, so decode orjson's UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+def create_driver(debugging_port=DEBUGGING_PORT, temp_dirs=None):
+    """Launch headless Chrome with Lambda-compatible options"""
+    user_data_dir, data_path, disk_cache_dir = temp_dirs or (_USER_DIR, _DATA_DIR, _CACHE_DIR)
+    options = webdriver.ChromeOptions()
+    # Return from driver.get() at DOMContentLoaded; extract_faqs waits for the questions explicitly
+    options.page_load_strategy = "eager"
+    service = webdriver.ChromeService("/opt/chromedriver")
+
+    options.binary_location = '/opt/chrome/chrome'
+    options.add_argument("--headless=new")
+    options.add_argument('--no-sandbox')
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1280x1696")
+    options.add_argument("--single-process")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-dev-tools")
+    options.add_argument("--no-zygote")
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    options.add_argument(f"--data-path={data_path}")
+    options.add_argument(f"--disk-cache-dir={disk_cache_dir}")
+    options.add_argument(f"--remote-debugging-port={debugging_port}")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-default-apps")
+
+    # FAQ extraction only needs text; skip images, stylesheets and fonts
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    })
+
+    driver = webdriver.Chrome(service=service, options=options)
+
+    # Explicit waits only; driver.get and execute_script raise TimeoutException past these limits
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
+    driver.implicitly_wait(0)
+    return driver
+
+def _get_driver():
+    """Return the warm Chrome driver, launching it on first use or after a failure"""
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = create_driver()
+    return _DRIVER
+
+def _discard_driver():
+    """Quit the warm driver so the next invocation launches a fresh one"""
+    global _DRIVER, _USER_DIR, _DATA_DIR, _CACHE_DIR
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+            logger.info("🧹 Chrome driver closed")
+        except WebDriverException:
+            pass
+        _DRIVER = None
+
+    # Relaunch on fresh dirs: a Chrome that outlived a failed quit() may still hold the
+    # old profile's SingletonLock, and removing the old cache keeps /tmp bounded
+    for temp_dir in (_USER_DIR, _DATA_DIR, _CACHE_DIR):
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    _USER_DIR, _DATA_DIR, _CACHE_DIR = mkdtemp(), mkdtemp(), mkdtemp()
+
+def extract_faqs(driver, url):
+    """Load a FAQ page and extract its question/answer pairs"""
+    logger.info("🌐 Navigating to: %s", url)
+    driver.get(url)
+
+    # Wait only until the questions are in the DOM; on timeout extract whatever has loaded
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, _TITLE_SELECTOR)))
+    except TimeoutException:
+        logger.warning("⚠️ Timed out waiting for FAQ questions on %s", url)
+
+    # Extract FAQs in a single in-browser pass over the document as it is now
+    logger.info("🔍 Extracting FAQ data...")
+    faq_data = driver.execute_script(EXTRACT_FAQS_JS)
+
+    return faq_data
+
+def extract_faqs_static(html):
+    """
+    Extract FAQs from raw HTML with the same pairing rules as EXTRACT_FAQS_JS.
+    Only card-title headings count, so an app shell's stray h6 never passes for a FAQ.
+    """
+    tree = LexborHTMLParser(html)
+    faq_data = []
+    seen = set()
+
+    for i, heading in enumerate(tree.css(_TITLE_SELECTOR), 1):
+        question_text = inner_text(heading)
+        if len(question_text) < 5 or question_text in seen:
+            continue
+        seen.add(question_text)
+
+        sibling = heading.next
+        while sibling is not None and sibling.tag != "p":
+            sibling = sibling.next
+
+        if sibling is not None:
+            answer_text = inner_text(sibling)
+        else:
+            paragraphs = heading.parent.css("p") if heading.parent is not None else []
+            answer_text = next((t for t in (inner_text(p) for p in paragraphs) if len(t) > len(question_text)), "Answer not found")
+
+        faq_data.append({
+            "id": f"faq-{i}",
+            "question": question_text,
+            "answer": answer_text,
+            "order": i
+        })
+
+    return faq_data
+
+def _static_faqs(url):
+    """Fetch and parse a page over plain HTTP, reusing the result for STATIC_CACHE_TTL seconds"""
+    cached = _STATIC_CACHE.get(url)
+    if cached is not None and time.time() - cached[0] < STATIC_CACHE_TTL:
+        return cached[1]
+
+    response = httpx.get(url, timeout=10, headers={"User-Agent": USER_AGENT}, follow_redirects=True)
+    response.raise_for_status()
+    faq_data = tuple(extract_faqs_static(response.text))
+    _STATIC_CACHE[url] = (time.time(), faq_data)
+    return faq_data
+
+def scrape_static(url):
+    """Return the FAQs of a server-rendered page, or an empty list if it needs a browser"""
+    try:
+        faq_data = list(_static_faqs(url))
+    except httpx.HTTPError as e:
+        logger.warning("⚠️ HTTP fetch failed for %s: %s", url, e)
+        return []
+
+    if faq_data:
+        logger.info("⚡ Extracted %d FAQs from %s without a browser", len(faq_data), url)
+    return faq_data
+
+def _scrape_one(url, debugging_port=DEBUGGING_PORT):
+    """Scrape one URL over HTTP, falling back to its own Chrome instance"""
+    faq_data = scrape_static(url)
+    if faq_data:
+        return faq_data
+
+    temp_dirs = (mkdtemp(), mkdtemp(), mkdtemp())
+    driver = None
+    try:
+        driver = create_driver(debugging_port, temp_dirs)
+        return extract_faqs(driver, url)
+    finally:
+        if driver:
+            driver.quit()
+            logger.info("🧹 Chrome driver closed")
+        for temp_dir in temp_dirs:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+def _scrape_worker(url, debugging_port, conn):
+    """Child-process entry point: scrape one URL and send the result back over the pipe"""
+    try:
+        faq_data = _scrape_one(url, debugging_port)
+        conn.send({"url": url, "success": True, "count": len(faq_data), "data": faq_data})
+    except Exception as e:
+        logger.error("❌ Error scraping %s: %s", url, e)
+        conn.send({"url": url, "success": False, "error": str(e)})
+    finally:
+        conn.close()
+
+def _scrape_many(urls):
+    """
+    Scrape several URLs in parallel, one Chrome per child process.
+
+    Uses Process + Pipe rather than ProcessPoolExecutor/Queue, which need
+    /dev/shm semaphores that Lambda does not provide.
+    """
+    max_workers = min(len(urls), os.cpu_count() or 1)
+    results = []
+
+    for start in range(0, len(urls), max_workers):
+        batch = []
+        for offset, url in enumerate(urls[start:start + max_workers]):
+            parent_conn, child_conn = Pipe(duplex=False)
+            process = Process(target=_scrape_worker, args=(url, DEBUGGING_PORT + 1 + offset, child_conn))
+            process.start()
+            child_conn.close()
+            batch.append((url, process, parent_conn))
+
+        for url, process, parent_conn in batch:
+            try:
+                results.append(parent_conn.recv())
+            except EOFError:
+                results.append({"url": url, "success": False, "error": "Worker exited without a result"})
+            process.join()
+
+    return results
+
 def lambda_handler(event=None, context=None):
     start_time = time.time()
-    driver = None
     try:
-        # Setup Chrome driver with Lambda-compatible options
-        options = webdriver.ChromeOptions()
-        service = webdriver.ChromeService("/opt/chromedriver")
-
-        options.binary_location = '/opt/chrome/chrome'
-        options.add_argument("--headless=new")
-        options.add_argument('--no-sandbox')
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1280x1696")
-        options.add_argument("--single-process")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-dev-tools")
-        options.add_argument("--no-zygote")
-        options.add_argument(f"--user-data-dir={mkdtemp()}")
-        options.add_argument(f"--data-path={mkdtemp()}")
-        options.add_argument(f"--disk-cache-dir={mkdtemp()}")
-        options.add_argument("--remote-debugging-port=9222")
-
-        driver = webdriver.Chrome(service=service, options=options)
+        urls = event.get("urls")
+        if urls:
+            logger.info(f"🚀 Scraping {len(urls)} URLs in parallel")
+            results = _scrape_many(urls)
+            total_count = sum(result.get("count", 0) for result in results)
+
+            execution_time = round(time.time() - start_time, 2)
+            logger.info(f"✅ Extracted {total_count} FAQs from {len(urls)} URLs in {execution_time} seconds")
+
+            return {
+                "statusCode": 200,
+                "headers": {
+                    "Content-Type": "application/json",
+                    "Access-Control-Allow-Origin": "*"
+                },
+                "body": _dumps({
+                    "success": all(result["success"] for result in results),
+                    "count": total_count,
+                    "results": results,
+                    "execution_time": execution_time
+                })
+            }
 
         # Get URL
         url = event.get("url", "https://mycash.utah.gov/app/faq-general")
-        logger.info(f"🌐 Navigating to: {url}")
-        driver.get(url)
-        time.sleep(3)
 
-        # Extract FAQs
-        logger.info("🔍 Extracting FAQ data...")
-        faq_data = []
-        question_elements = driver.find_elements(By.CSS_SELECTOR, "h6.card-title") or driver.find_elements(By.TAG_NAME, "h6")
+        # Only launch Chrome when the FAQs are not in the server-rendered HTML
+        faq_data = scrape_static(url)
+        if not faq_data:
+            try:
+                driver = _get_driver()
+                faq_data = extract_faqs(driver, url)
+            except Exception:
+                _discard_driver()
+                raise
 
-        for i, q_elem in enumerate(question_elements, 1):
+            # Leave the warm browser clean for the next invocation and keep its disk cache bounded;
+            # if that fails, start fresh next time but still return what was extracted
             try:
-                question_text = q_elem.text.strip()
-                if not question_text or len(question_text) < 5:
-                    continue
-
-                # Attempt to find the answer
-                try:
-                    answer_elem = q_elem.find_element(By.XPATH, "./following-sibling::p[1]")
-                    answer_text = answer_elem.text.strip()
-                except:
-                    try:
-                        parent = q_elem.find_element(By.XPATH, "./..")
-                        paragraphs = parent.find_elements(By.TAG_NAME, "p")
-                        answer_text = next((p.text.strip() for p in paragraphs if len(p.text.strip()) > len(question_text)), "Answer not found")
-                    except:
-                        answer_text = "Answer not found"
-
-                faq_data.append({
-                    "id": f"faq-{i}",
-                    "question": question_text,
-                    "answer": answer_text,
-                    "order": i
-                })
-            except Exception as e:
-                logger.warning(f"⚠️ Error parsing question {i}: {e}")
-                continue
+                driver.delete_all_cookies()
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                driver.get("about:blank")
+            except WebDriverException as e:
+                logger.warning("⚠️ Warm Chrome cleanup failed, discarding it: %s", e)
+                _discard_driver()
 
         execution_time = round(time.time() - start_time, 2)
         logger.info(f"✅ Extracted {len(faq_data)} FAQs in {execution_time} seconds")
@@ -82,7 +340,7 @@ def lambda_handler(event=None, context=None):
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps({
+            "body": _dumps({
                 "success": True,
                 "count": len(faq_data),
                 "data": faq_data,
@@ -91,8 +349,24 @@ def lambda_handler(event=None, context=None):
             })
         }
 
+    except TimeoutException as e:
+        logger.error("⏱️ Page load timed out: %s", e)
+        execution_time = round(time.time() - start_time, 2)
+        return {
+            "statusCode": 504,
+            "headers": {
+                "Content-Type": "application/json",
+                "Access-Control-Allow-Origin": "*"
+            },
+            "body": _dumps({
+                "success": False,
+                "error": "Page load timed out",
+                "execution_time": execution_time
+            })
+        }
+
     except Exception as e:
-        logger.error(f"❌ Lambda error: {str(e)}")
+        logger.error("❌ Lambda error: %s", e)
         execution_time = round(time.time() - start_time, 2)
         return {
             "statusCode": 500,
@@ -100,14 +374,9 @@ def lambda_handler(event=None, context=None):
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps({
+            "body": _dumps({
                 "success": False,
                 "error": str(e),
                 "execution_time": execution_time
             })
         }
-
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("🧹 Chrome driver closed")